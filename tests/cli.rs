@@ -168,7 +168,8 @@ fn select_1_writes_history_file() {
     use std::io::Read;
     // A history file records the query on exit (covers write_history_to_file in
     // the real binary).
-    let hist = std::env::temp_dir().join(format!("sk_hist_{}", std::process::id()));
+    let dir = tempfile::tempdir().expect("create temp dir");
+    let hist = dir.path().join("history");
     let hist_path = hist.to_str().unwrap();
     // Pass argv explicitly: the temp path may contain spaces on some platforms.
     let (code, _stdout, _) = run_sk_argv("1\\n2\\n3", &["--select-1", "-q", "3", "--history", hist_path], &[]);
@@ -179,7 +180,6 @@ fn select_1_writes_history_file() {
         .read_to_string(&mut contents)
         .unwrap();
     assert!(contents.contains('3'));
-    let _ = std::fs::remove_file(&hist);
 }
 
 #[test]
@@ -194,7 +194,8 @@ fn select_1_print_current() {
 fn log_file_initializes_logger() {
     // --log-file routes env_logger to a file (covers init_logger's Pipe target
     // and builder). SKIM_LOG=trace makes the run actually emit records.
-    let log = std::env::temp_dir().join(format!("sk_log_{}", std::process::id()));
+    let dir = tempfile::tempdir().expect("create temp dir");
+    let log = dir.path().join("sk.log");
     let log_path = log.to_str().unwrap();
     let (code, _stdout, _) = run_sk_argv(
         "1\\n2\\n3",
@@ -204,7 +205,6 @@ fn log_file_initializes_logger() {
     assert_eq!(code, Some(0));
     // The log file was created by the file target.
     assert!(log.exists());
-    let _ = std::fs::remove_file(&log);
 }
 
 #[test]
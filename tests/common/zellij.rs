@@ -32,17 +32,16 @@
 use std::fmt::{Display, Formatter};
 use std::fs::File;
 use std::io::{BufReader, ErrorKind, Read, Result, Write};
-use std::path::Path;
 use std::process::{Command, Stdio};
-use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::{Arc, Mutex};
+use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
+use std::sync::{Arc, Mutex, OnceLock};
 use std::thread::sleep;
 use std::time::{Duration, Instant};
 
 use portable_pty::{CommandBuilder, MasterPty, PtySize, native_pty_system};
 use rand::RngExt as _;
 use rand::distr::Alphanumeric;
-use tempfile::{NamedTempFile, TempDir, tempdir};
+use tempfile::{TempDir, tempdir};
 use which::which;
 
 use crate::common::{SK, SKIM_ENV_REMOVES, SKIM_SHELL_ENV_CLEAR};
@@ -64,7 +63,15 @@ use crate::common::{SK, SKIM_ENV_REMOVES, SKIM_SHELL_ENV_CLEAR};
 ///   `default_shell "bash"` would leave the pane with no shell and nothing to
 ///   render. Backslashes are forward-slashed so the path survives KDL's string
 ///   escaping on Windows.
-fn zellij_config() -> String {
+///
+/// The config is identical for every session, so it is built (and `bash`
+/// looked up) once per process.
+fn zellij_config() -> &'static str {
+    static CONFIG: OnceLock<String> = OnceLock::new();
+    CONFIG.get_or_init(build_zellij_config)
+}
+
+fn build_zellij_config() -> String {
     let shell = which("bash")
         .ok()
         .and_then(|p| p.to_str().map(|s| s.replace('\\', "/")))
@@ -92,13 +99,20 @@ default_shell "{shell}"
 /// must be less than 0 characters" (zellij-org/zellij#4211) and the client exits
 /// before it attaches. Forcing a short base (`/tmp`) keeps the whole path well
 /// under the cap on Linux and macOS alike.
-fn zellij_socket_dir() -> Result<std::path::PathBuf> {
+///
+/// Every `zellij` call needs it, so the directory is only created (and the path
+/// only built) on first use.
+fn zellij_socket_dir() -> Result<&'static std::path::Path> {
+    static DIR: OnceLock<std::path::PathBuf> = OnceLock::new();
+    if let Some(dir) = DIR.get() {
+        return Ok(dir);
+    }
     #[cfg(unix)]
     let dir = std::path::PathBuf::from("/tmp/skim-zj");
     #[cfg(not(unix))]
     let dir = std::env::temp_dir().join("skim-zj");
     std::fs::create_dir_all(&dir)?;
-    Ok(dir)
+    Ok(DIR.get_or_init(|| dir))
 }
 
 /// Shell prompt installed once the pane comes up. It is deterministic (so the
@@ -174,11 +188,15 @@ const SESSION_SPAWN_ATTEMPTS: usize = 4;
 /// Poll `pred` until it succeeds or [`WAIT_BUDGET`] elapses. On timeout the most
 /// recent error returned by `pred` is surfaced, so a persistent failure keeps its
 /// diagnostic cause.
+///
+/// The pause between polls starts at 1ms and doubles up to 10ms, so a condition
+/// that becomes true right away is noticed right away.
 pub fn wait<F, T>(pred: F) -> Result<T>
 where
     F: Fn() -> Result<T>,
 {
     let deadline = Instant::now() + WAIT_BUDGET;
+    let mut delay = Duration::from_millis(1);
     loop {
         match pred() {
             Ok(t) => return Ok(t),
@@ -188,7 +206,8 @@ where
                 }
             }
         }
-        sleep(Duration::from_millis(10));
+        sleep(delay);
+        delay = (delay * 2).min(Duration::from_millis(10));
     }
 }
 
@@ -218,6 +237,9 @@ fn output_with_timeout(mut cmd: Command, timeout: Duration) -> Result<(Vec<u8>,
     });
 
     let deadline = Instant::now() + timeout;
+    // A healthy call exits within a few ms, so start polling tight and back off
+    // (up to 20ms) rather than always paying a full 20ms after it has exited.
+    let mut delay = Duration::from_millis(1);
     // Some(status) => the child exited; None => it was killed for timing out.
     let status = loop {
         match child.try_wait() {
@@ -227,7 +249,10 @@ fn output_with_timeout(mut cmd: Command, timeout: Duration) -> Result<(Vec<u8>,
                 let _ = child.wait();
                 break None;
             }
-            Ok(None) => sleep(Duration::from_millis(20)),
+            Ok(None) => {
+                sleep(delay);
+                delay = (delay * 2).min(Duration::from_millis(20));
+            }
             Err(e) => {
                 // Can't poll the child; don't leave it or the reader threads dangling.
                 let _ = child.kill();
@@ -299,10 +324,12 @@ impl Keys<'_> {
                 out.extend_from_slice(c.encode_utf8(&mut buf).as_bytes());
             }
             Ctrl(inner) => {
-                let mut inner_bytes = Vec::new();
-                inner.encode(&mut inner_bytes);
                 // Ctrl masks the low 5 bits of the (upper-cased) ASCII byte.
-                if let Some(&b) = inner_bytes.first() {
+                // Encode the inner key in place and keep only that first byte.
+                let start = out.len();
+                inner.encode(out);
+                if let Some(&b) = out.get(start) {
+                    out.truncate(start);
                     out.push(b.to_ascii_uppercase() & 0x1f);
                 }
             }
@@ -331,6 +358,9 @@ pub struct ZellijController {
     pub window: String,
     pub tempdir: TempDir,
     pub outfile: Option<String>,
+    // Counter behind `tempfile`: every name handed out is unique within
+    // `tempdir`, so there is no need to create (and unlink) a file to reserve it.
+    next_tempfile: AtomicUsize,
     // The client process and its master PTY must stay alive for the session's
     // lifetime: dropping the master hangs up the pane and tears the session
     // down early.
@@ -352,8 +382,11 @@ fn io_err<E: std::fmt::Display>(e: E) -> std::io::Error {
 }
 
 impl ZellijController {
-    fn zellij_bin() -> std::path::PathBuf {
-        which("zellij").expect("Please install zellij (>= 0.44) to $PATH")
+    /// Absolute path of the `zellij` binary, looked up on `$PATH` once: every
+    /// action spawns it, and re-scanning `$PATH` each time is wasted work.
+    fn zellij_bin() -> &'static std::path::Path {
+        static BIN: OnceLock<std::path::PathBuf> = OnceLock::new();
+        BIN.get_or_init(|| which("zellij").expect("Please install zellij (>= 0.44) to $PATH"))
     }
 
     /// Run `zellij <args>` with no session targeting and return stdout lines.
@@ -371,14 +404,24 @@ impl ZellijController {
     /// instead of observing a bogus "no session" message as pane content or
     /// hanging on a wedged server.
     fn action(&self, args: &[&str]) -> Result<String> {
+        let stdout = self.action_raw(args)?;
+        Ok(String::from_utf8_lossy(&stdout).into_owned())
+    }
+
+    /// Like [`action`](Self::action), but hands stdout back undecoded, for
+    /// callers that discard it anyway.
+    fn action_raw<I, S>(&self, args: I) -> Result<Vec<u8>>
+    where
+        I: IntoIterator<Item = S>,
+        S: AsRef<std::ffi::OsStr>,
+    {
         let mut cmd = Command::new(Self::zellij_bin());
         cmd.env("ZELLIJ_SOCKET_DIR", zellij_socket_dir()?)
             .args(["--session", &self.window, "action"])
             .args(args);
-        let (stdout_bytes, stderr_bytes) = output_with_timeout(cmd, ZELLIJ_CMD_TIMEOUT)?;
-        let stdout = String::from_utf8_lossy(&stdout_bytes).to_string();
-        let stderr = String::from_utf8_lossy(&stderr_bytes);
-        if stderr.contains("not found") || stdout.contains("no active session") {
+        let (stdout, stderr) = output_with_timeout(cmd, ZELLIJ_CMD_TIMEOUT)?;
+        let contains = |haystack: &[u8], needle: &[u8]| haystack.windows(needle.len()).any(|w| w == needle);
+        if contains(&stderr, b"not found") || contains(&stdout, b"no active session") {
             return Err(std::io::Error::new(ErrorKind::NotConnected, "zellij session not ready"));
         }
         Ok(stdout)
@@ -386,10 +429,8 @@ impl ZellijController {
 
     /// Inject raw terminal input bytes into the focused pane.
     fn write_bytes(&self, bytes: &[u8]) -> Result<()> {
-        let mut args: Vec<String> = vec!["write".to_string()];
-        args.extend(bytes.iter().map(|b| b.to_string()));
-        let refs: Vec<&str> = args.iter().map(String::as_str).collect();
-        self.action(&refs)?;
+        let args = std::iter::once("write".to_string()).chain(bytes.iter().map(u8::to_string));
+        self.action_raw(args)?;
         Ok(())
     }
 
@@ -521,6 +562,7 @@ impl ZellijController {
             window: session,
             tempdir,
             outfile: None,
+            next_tempfile: AtomicUsize::new(0),
             master: pair.master,
             child: Some(child),
             client_output,
@@ -651,22 +693,54 @@ impl ZellijController {
 
     /// Send a sequence of keystrokes to the pane, each encoded to the raw
     /// terminal bytes a real terminal would deliver.
+    ///
+    /// Consecutive keys are coalesced into a single `zellij action write` call,
+    /// since every call is a full client spawn. The one exception is a bare
+    /// `ESC`: followed by more bytes in the same write, `sk` would parse it as
+    /// an Alt prefix or the start of an escape sequence, so the batch is flushed
+    /// right after it.
     pub fn send_keys(&self, keys: &[Keys]) -> std::io::Result<()> {
         print!("typing `");
+        let mut bytes = Vec::new();
         for key in keys {
-            let mut bytes = Vec::new();
             key.encode(&mut bytes);
+            print!("{}", key);
+            if bytes.last() == Some(&0x1b) {
+                self.write_bytes(&bytes)?;
+                bytes.clear();
+            }
+        }
+        if !bytes.is_empty() {
             self.write_bytes(&bytes)?;
+        }
+        println!("`");
+        Ok(())
+    }
+
+    /// Like [`send_keys`](Self::send_keys), but with one `zellij action write`
+    /// per key, so each keystroke reaches the pane as a separate read. Use it
+    /// where the test is about input arriving over time, such as `sk`'s reader
+    /// racing an `execute` child for the terminal.
+    pub fn send_keys_each(&self, keys: &[Keys]) -> std::io::Result<()> {
+        print!("typing `");
+        for key in keys {
+            let mut bytes = Vec::new();
+            key.encode(&mut bytes);
             print!("{}", key);
+            self.write_bytes(&bytes)?;
         }
         println!("`");
         Ok(())
     }
 
-    /// Allocate a fresh temp file path inside this controller's tempdir.
+    /// Allocate a fresh temp file path inside this controller's tempdir. The
+    /// file itself is not created.
     pub fn tempfile(&self) -> Result<String> {
-        Ok(NamedTempFile::new_in(&self.tempdir)?
+        let n = self.next_tempfile.fetch_add(1, Ordering::Relaxed);
+        Ok(self
+            .tempdir
             .path()
+            .join(format!("out-{n}"))
             .to_str()
             .ok_or_else(|| std::io::Error::new(ErrorKind::InvalidData, "temp file path is not valid UTF-8"))?
             .to_string())
@@ -732,23 +806,14 @@ impl ZellijController {
 
     /// Capture skim output from explicit outfile path
     pub fn output_from(&self, outfile: &str) -> Result<Vec<String>> {
-        wait(|| {
-            if Path::new(&outfile).exists() {
-                Ok(())
-            } else {
-                Err(std::io::Error::new(ErrorKind::NotFound, "outfile does not exist yet"))
-            }
-        })?;
+        // Opening the file doubles as the existence check: it fails with
+        // `NotFound` until the `.part` rename in `sk` lands, and `wait` retries.
+        let file = wait(|| File::open(outfile))?;
         let mut string_lines = String::new();
-        BufReader::new(File::open(outfile)?).read_to_string(&mut string_lines)?;
+        BufReader::new(file).read_to_string(&mut string_lines)?;
 
         let str_lines = string_lines.trim();
-        Ok(str_lines
-            .split("\n")
-            .map(|s| s.to_string())
-            .collect::<Vec<String>>()
-            .into_iter()
-            .collect())
+        Ok(str_lines.split("\n").map(|s| s.to_string()).collect())
     }
 
     /// Launch `sk` in the pane with `opts`, optionally piping `stdin_cmd` into
@@ -928,7 +993,7 @@ impl Drop for ZellijController {
 // - You can chain methods: trim().starts_with("foo")
 // - Negative indices work like Python: -1 is last element, -2 is second-to-last, etc.
 // - ALL methods use wait() with retry logic - no immediate assertions
-// - wait() retries every 10ms for up to 10 seconds before timing out
+// - wait() retries (backing off from 1ms to 10ms) for up to WAIT_BUDGET before timing out
 //
 #[allow(unused_macros)]
 macro_rules! sk_test {
@@ -92,8 +92,11 @@ printf '%s' "$s" > "$out"
         }
     })?;
 
-    // Feed the child four distinct keystrokes.
-    tmux.send_keys(&[Key('w'), Key('x'), Key('y'), Key('z')])?;
+    // Feed the child four distinct keystrokes, one write each. With skim's
+    // reader suspended as above, the child gets all of them; should bug 1
+    // regress, a racing reader gets four chances to steal one, instead of a
+    // single all-or-nothing grab at one batched write.
+    tmux.send_keys_each(&[Key('w'), Key('x'), Key('y'), Key('z')])?;
 
     // The child finishes only if it received every keystroke.
     wait(|| match read_file(&result) {